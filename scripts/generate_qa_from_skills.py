@@ -14,27 +14,45 @@ Usage:
 """
 
 import argparse
+import asyncio
+import functools
+import hashlib
 import json
-import subprocess
+import os
 import sys
 import re
+import time
 from pathlib import Path
-from typing import Dict, List, Optional
+from typing import Dict, List, Optional, TextIO
 
+from llm_client import (
+    CLAUDE_MODELS, call_claude_sdk, call_gemini_sdk, iter_json_objects, sdk_available
+)
 
-# Base path to UnifyWeaver project
-# training-data/scripts/ -> training-data/ -> UnifyWeaver/
-UNIFYWEAVER_BASE = Path(__file__).parent.parent.parent
-SKILLS_DIR = UNIFYWEAVER_BASE / "skills"
 
-# If running from training-data subdir, adjust path
-if not SKILLS_DIR.exists():
-    # Try absolute path
-    UNIFYWEAVER_BASE = Path("/home/s243a/Projects/UnifyWeaver")
-    SKILLS_DIR = UNIFYWEAVER_BASE / "skills"
+@functools.cache
+def _resolve_skills_dir() -> Path:
+    """Locate the UnifyWeaver skills/ directory.
 
+    Resolved on first use rather than at import time, so --help and
+    other early exits never stat the filesystem.
+    """
+    # training-data/scripts/ -> training-data/ -> UnifyWeaver/
+    skills_dir = Path(__file__).parent.parent.parent / "skills"
+    if not skills_dir.exists():
+        # If running from training-data subdir, try absolute path
+        skills_dir = Path("/home/s243a/Projects/UnifyWeaver") / "skills"
+    return skills_dir
 
-GENERATION_PROMPT = '''You are generating Q&A training data for UnifyWeaver's quickstart agent.
+
+# Prompts are rendered by plain f-string functions rather than
+# str.format templates so the format machinery doesn't re-parse a
+# 30-line template on every call.
+
+def render_skill_prompt(skill_file: str, skill_content: str, num_pairs: int,
+                        skill_id: str, tree_path: str) -> str:
+    """Render the single-skill generation prompt."""
+    return f'''You are generating Q&A training data for UnifyWeaver's quickstart agent.
 
 Given this SKILL document, generate {num_pairs} Q&A pairs.
 
@@ -60,29 +78,87 @@ IMPORTANT:
 Generate ONLY the JSONL output, no explanations.'''
 
 
-def call_claude_cli(prompt: str, model: str = "sonnet", timeout: int = 120) -> Optional[str]:
+def render_marshaled_prompt(num_pairs: int, skill_blocks: str) -> str:
+    """Render the marshaled prompt: several skills, one LLM call.
+
+    Each output line carries "_skill_id" so results can be demultiplexed.
+    """
+    return f'''You are generating Q&A training data for UnifyWeaver's quickstart agent.
+
+Given the SKILL documents below, generate {num_pairs} Q&A pairs PER SKILL.
+
+{skill_blocks}
+
+Generate Q&A pairs that:
+1. Questions should be what a NEW USER would ask (based on "When to Use" section)
+2. Answers should be concise, include key commands/examples, and END with "See <skill file> for details."
+3. Include the skill file in related_skills
+4. Include any docs/code mentioned in "Related" section in related_docs
+
+Output format (JSONL, one per line, tagged with the skill it came from):
+{{"_skill_id": "<skill_id>", "id": "<skill_id>_001", "question": "...", "question_variants": ["...", "..."], "level": 2, "tree_path": <tree_path>, "answer": "...", "related_skills": ["<skill file>"], "related_docs": [...], "tags": [...]}}
+
+IMPORTANT:
+- Level 2 = general task ("How do I organize mindmaps?")
+- Level 3 = specific task ("How do I use MST clustering?")
+- Questions should NOT mention the skill name - users don't know skill names!
+- Every line MUST include the "_skill_id" of the skill it was generated from.
+
+Generate ONLY the JSONL output, no explanations.'''
+
+
+def render_marshaled_block(skill_id: str, skill_file: str, tree_path: str,
+                           skill_content: str) -> str:
+    """Render one skill's block for the marshaled prompt."""
+    return f'''=== SKILL: {skill_id} ===
+SKILL FILE: {skill_file}
+TREE PATH: {tree_path}
+
+{skill_content}'''
+
+# Diminishing returns past this batch size; keeps single responses parseable
+MAX_MARSHAL_BATCH = 8
+
+
+async def call_claude_cli(prompt: str, model: str = "sonnet", timeout: int = 120) -> Optional[str]:
     """Call claude CLI."""
     try:
-        result = subprocess.run(
-            ["claude", "-p", "--model", model, prompt],
-            capture_output=True,
-            text=True,
-            timeout=timeout
+        # Prompt goes over stdin: argv has an ARG_MAX ceiling that large
+        # skills or marshaled batches would hit, and exec copies argv
+        proc = await asyncio.create_subprocess_exec(
+            "claude", "-p", "--model", model,
+            stdin=asyncio.subprocess.PIPE,
+            stdout=asyncio.subprocess.PIPE,
+            stderr=asyncio.subprocess.PIPE
         )
-        if result.returncode == 0:
-            return result.stdout.strip()
+        stdout, stderr = await asyncio.wait_for(
+            proc.communicate(input=prompt.encode()), timeout=timeout
+        )
+        if proc.returncode == 0:
+            return stdout.decode().strip()
         else:
-            print(f"CLI error: {result.stderr[:200]}", file=sys.stderr)
+            print(f"CLI error: {stderr.decode()[:200]}", file=sys.stderr)
             return None
-    except subprocess.TimeoutExpired:
+    except asyncio.TimeoutError:
         print(f"Timeout after {timeout}s", file=sys.stderr)
+        # Kill the hung CLI, but bound the reap too: asyncio only wakes
+        # exit waiters once all stdout/stderr pipes disconnect, so a
+        # child that inherited the pipes would otherwise block us here
+        # long past the timeout window
+        proc.kill()
+        try:
+            await asyncio.wait_for(proc.wait(), timeout=5)
+        except asyncio.TimeoutError:
+            # An orphaned child still holds the pipes; tear the
+            # transport down ourselves and move on
+            proc._transport.close()
         return None
     except Exception as e:
         print(f"Exception: {e}", file=sys.stderr)
         return None
 
 
-def call_gemini_cli(prompt: str, model: str = "", timeout: int = 120) -> Optional[str]:
+async def call_gemini_cli(prompt: str, model: str = "", timeout: int = 120) -> Optional[str]:
     """Call gemini CLI."""
     try:
         # Use stdin to avoid shell escaping issues with special characters
@@ -90,35 +166,135 @@ def call_gemini_cli(prompt: str, model: str = "", timeout: int = 120) -> Optiona
         cmd = ["gemini", "--output-format", "text"]
         if model:
             cmd.extend(["-m", model])
-        result = subprocess.run(
-            cmd,
-            input=prompt,
-            capture_output=True,
-            text=True,
-            timeout=timeout,
+        proc = await asyncio.create_subprocess_exec(
+            *cmd,
+            stdin=asyncio.subprocess.PIPE,
+            stdout=asyncio.subprocess.PIPE,
+            stderr=asyncio.subprocess.PIPE,
             cwd=str(Path.cwd())
         )
-        if result.returncode == 0:
-            return result.stdout.strip()
+        stdout, stderr = await asyncio.wait_for(
+            proc.communicate(input=prompt.encode()), timeout=timeout
+        )
+        if proc.returncode == 0:
+            return stdout.decode().strip()
         else:
-            print(f"Gemini CLI error: {result.stderr[:200]}", file=sys.stderr)
+            print(f"Gemini CLI error: {stderr.decode()[:200]}", file=sys.stderr)
             return None
-    except subprocess.TimeoutExpired:
+    except asyncio.TimeoutError:
         print(f"Timeout after {timeout}s", file=sys.stderr)
+        proc.kill()
+        try:
+            # Bounded reap; see call_claude_cli
+            await asyncio.wait_for(proc.wait(), timeout=5)
+        except asyncio.TimeoutError:
+            proc._transport.close()
         return None
     except Exception as e:
         print(f"Exception: {e}", file=sys.stderr)
         return None
 
 
-def call_llm(prompt: str, provider: str = "claude", model: str = "sonnet") -> Optional[str]:
-    """Call LLM based on provider."""
+_sdk_fallback_warned = set()
+
+# Content-addressed response cache: re-running --all only re-generates
+# skills whose prompt (and therefore content) changed
+QA_CACHE_DIR = Path(".qa_cache")
+
+
+def _cache_path(provider: str, model: str, prompt: str) -> Path:
+    key = hashlib.sha256(f"{provider}|{model}|{prompt}".encode()).hexdigest()
+    return QA_CACHE_DIR / key[:2] / f"{key}.txt"
+
+
+async def call_llm(prompt: str, provider: str = "claude", model: str = "sonnet",
+                   transport: str = "sdk", use_cache: bool = True) -> Optional[str]:
+    """Call LLM based on provider and transport."""
+    cache_path = _cache_path(provider, model, prompt) if use_cache else None
+    if cache_path and cache_path.exists():
+        return cache_path.read_text()
+
+    response = await _call_llm_uncached(prompt, provider, model, transport)
+
+    if response and cache_path:
+        cache_path.parent.mkdir(parents=True, exist_ok=True)
+        # Atomic write so a crashed run never leaves a partial cache entry
+        tmp_path = cache_path.with_suffix('.tmp')
+        tmp_path.write_text(response)
+        os.replace(tmp_path, cache_path)
+
+    return response
+
+
+async def _call_llm_uncached(prompt: str, provider: str = "claude", model: str = "sonnet",
+                             transport: str = "sdk") -> Optional[str]:
+    if transport == "sdk" and not sdk_available(provider):
+        if provider not in _sdk_fallback_warned:
+            _sdk_fallback_warned.add(provider)
+            print(f"Note: {provider} SDK not installed, falling back to CLI transport",
+                  file=sys.stderr)
+        transport = "cli"
+
     if provider == "gemini":
         # For gemini, use specified model if it starts with "gemini", otherwise default to gemini-3-flash-preview
         gemini_model = model if model.startswith("gemini") else "gemini-3-flash-preview"
-        return call_gemini_cli(prompt, gemini_model)
+        if transport == "sdk":
+            return await call_gemini_sdk(prompt, gemini_model)
+        return await call_gemini_cli(prompt, gemini_model)
     else:
-        return call_claude_cli(prompt, model)
+        if transport == "sdk":
+            return await call_claude_sdk(prompt, model)
+        return await call_claude_cli(prompt, model)
+
+
+def call_batch_api(prompts: List[str], model: str = "sonnet",
+                   poll_interval: int = 30) -> List[Optional[str]]:
+    """Submit all prompts as one job via the Anthropic Message Batches API.
+
+    Batched requests cost ~50% of interactive calls and avoid per-request
+    rate limits. Blocks until the batch completes, polling with backoff.
+    Requires the anthropic SDK (pip install anthropic).
+    """
+    try:
+        import anthropic
+    except ImportError:
+        print("Error: --batch-api requires the anthropic SDK (pip install anthropic)",
+              file=sys.stderr)
+        sys.exit(1)
+
+    client = anthropic.Anthropic()
+    requests = [
+        {
+            "custom_id": f"skill-{i}",
+            "params": {
+                "model": CLAUDE_MODELS.get(model, model),
+                "max_tokens": 4096,
+                "messages": [{"role": "user", "content": prompt}],
+            },
+        }
+        for i, prompt in enumerate(prompts)
+    ]
+    batch = client.messages.batches.create(requests=requests)
+    print(f"  Submitted batch {batch.id} ({len(prompts)} requests)")
+
+    delay = poll_interval
+    while True:
+        batch = client.messages.batches.retrieve(batch.id)
+        if batch.processing_status == "ended":
+            break
+        print(f"  Batch {batch.id}: {batch.processing_status}, next poll in {delay}s")
+        time.sleep(delay)
+        delay = min(delay * 2, 300)
+
+    results: List[Optional[str]] = [None] * len(prompts)
+    for entry in client.messages.batches.results(batch.id):
+        idx = int(entry.custom_id.split('-', 1)[1])
+        if entry.result.type == "succeeded":
+            results[idx] = entry.result.message.content[0].text.strip()
+        else:
+            print(f"  Batch request {entry.custom_id}: {entry.result.type}",
+                  file=sys.stderr)
+    return results
 
 
 def infer_topic_from_skill(skill_name: str) -> str:
@@ -135,12 +311,15 @@ def infer_topic_from_skill(skill_name: str) -> str:
         return 'quickstart'
 
 
+_TITLE_RE = re.compile(r'^# Skill: (.+)$', re.MULTILINE)
+
+
 def infer_tree_path(skill_name: str, skill_content: str) -> List[str]:
     """Infer tree path from skill name and content."""
     topic = infer_topic_from_skill(skill_name)
 
     # Extract skill title from content
-    title_match = re.search(r'^# Skill: (.+)$', skill_content, re.MULTILINE)
+    title_match = _TITLE_RE.search(skill_content)
     if title_match:
         subtopic = title_match.group(1)
     else:
@@ -149,21 +328,15 @@ def infer_tree_path(skill_name: str, skill_content: str) -> List[str]:
     return [topic.title(), subtopic]
 
 
-def generate_qa_from_skill(
-    skill_path: Path,
-    provider: str = "claude",
-    model: str = "sonnet",
-    num_pairs: int = 4
-) -> List[Dict]:
-    """Generate Q&A pairs from a skill file."""
-
+def build_skill_prompt(skill_path: Path, num_pairs: int = 4) -> str:
+    """Build the single-skill generation prompt."""
     skill_content = skill_path.read_text()
     skill_name = skill_path.name
     skill_id = skill_name.replace('.md', '').replace('-', '_')
 
     tree_path = infer_tree_path(skill_name, skill_content)
 
-    prompt = GENERATION_PROMPT.format(
+    return render_skill_prompt(
         skill_file=skill_name,
         skill_content=skill_content,
         num_pairs=num_pairs,
@@ -171,30 +344,138 @@ def generate_qa_from_skill(
         tree_path=json.dumps(tree_path)
     )
 
-    print(f"  Generating from {skill_name}...")
-    response = call_llm(prompt, provider, model)
 
+def parse_skill_response(response: Optional[str], skill_name: str) -> List[Dict]:
+    """Parse a JSONL response into Q&A pairs for one skill."""
     if not response:
         return []
 
-    # Parse JSONL response
     results = []
-    for line in response.split('\n'):
-        line = line.strip()
-        if line.startswith('{'):
-            try:
-                obj = json.loads(line)
-                # Ensure skill is in related_skills
-                if skill_name not in obj.get('related_skills', []):
-                    obj.setdefault('related_skills', []).append(skill_name)
-                results.append(obj)
-            except json.JSONDecodeError:
-                pass
+    for obj in iter_json_objects(response):
+        # Ensure skill is in related_skills
+        if skill_name not in obj.get('related_skills', []):
+            obj.setdefault('related_skills', []).append(skill_name)
+        results.append(obj)
 
     return results
 
 
-def analyze_coverage() -> Dict[str, List[str]]:
+async def generate_qa_from_skill(
+    skill_path: Path,
+    semaphore: asyncio.Semaphore,
+    provider: str = "claude",
+    model: str = "sonnet",
+    num_pairs: int = 4,
+    transport: str = "sdk",
+    use_cache: bool = True
+) -> List[Dict]:
+    """Generate Q&A pairs from a skill file."""
+
+    prompt = build_skill_prompt(skill_path, num_pairs)
+
+    print(f"  Generating from {skill_path.name}...")
+    async with semaphore:
+        response = await call_llm(prompt, provider, model, transport, use_cache)
+
+    return parse_skill_response(response, skill_path.name)
+
+
+async def generate_qa_from_skill_batch(
+    skill_paths: List[Path],
+    semaphore: asyncio.Semaphore,
+    provider: str = "claude",
+    model: str = "sonnet",
+    num_pairs: int = 4,
+    transport: str = "sdk",
+    use_cache: bool = True
+) -> List[List[Dict]]:
+    """Generate Q&A pairs for several skills with one marshaled LLM call.
+
+    Returns one result list per input skill, in order.
+    """
+    entries = []
+    for skill_path in skill_paths:
+        skill_content = skill_path.read_text()
+        skill_name = skill_path.name
+        skill_id = skill_name.replace('.md', '').replace('-', '_')
+        tree_path = infer_tree_path(skill_name, skill_content)
+        entries.append((skill_id, skill_name, skill_content, tree_path))
+
+    skill_blocks = '\n\n'.join(
+        render_marshaled_block(
+            skill_id=skill_id,
+            skill_file=skill_name,
+            tree_path=json.dumps(tree_path),
+            skill_content=skill_content
+        )
+        for skill_id, skill_name, skill_content, tree_path in entries
+    )
+    prompt = render_marshaled_prompt(num_pairs=num_pairs, skill_blocks=skill_blocks)
+
+    print(f"  Generating from batch of {len(entries)} skills...")
+    async with semaphore:
+        response = await call_llm(prompt, provider, model, transport, use_cache)
+
+    # Demultiplex response lines back to their skills by _skill_id
+    by_skill: Dict[str, List[Dict]] = {skill_id: [] for skill_id, _, _, _ in entries}
+    if response:
+        for obj in iter_json_objects(response):
+            skill_id = obj.pop('_skill_id', None)
+            if skill_id in by_skill:
+                by_skill[skill_id].append(obj)
+
+    results = []
+    for skill_id, skill_name, _, _ in entries:
+        pairs = by_skill[skill_id]
+        for obj in pairs:
+            # Ensure skill is in related_skills
+            if skill_name not in obj.get('related_skills', []):
+                obj.setdefault('related_skills', []).append(skill_name)
+        results.append(pairs)
+
+    return results
+
+
+# Filename cue -> capability-tree keywords it covers. Keys are single
+# tokens or adjacent-token bigrams of the skill filename.
+_SKILL_KEYWORD_MAP = {
+    'mindmap': ('mindmap',),
+    'mst': ('mindmap', 'mst folder grouping'),
+    'link': ('link to pearltrees',),
+    'folder_grouping': ('mst folder grouping',),
+    'cross': ('cross-references',),
+    'relative_link': ('cross-references',),
+    'folder_suggestion': ('folder suggestion',),
+    'suggest': ('folder suggestion',),
+    'suggestion': ('folder suggestion',),
+    'rename': ('rename mindmap',),
+    'index': ('build index',),
+    'bookmark': ('bookmark filing',),
+    'compile': ('compile prolog',),
+    'environment': ('environment setup',),
+    'json': ('data sources',),
+    'extract': ('data extraction',),
+    'extraction': ('data extraction',),
+}
+
+
+def _token_variants(tok: str):
+    """Yield a token plus lightly stemmed forms.
+
+    The map keys are base forms; filenames use variants like linking,
+    indexing or folder_suggestions, which the old substring checks
+    matched for free. Stripping -ing/-es/-s recovers those hits.
+    """
+    yield tok
+    if tok.endswith('ing'):
+        yield tok[:-3]
+    if tok.endswith('es'):
+        yield tok[:-2]
+    if tok.endswith('s'):
+        yield tok[:-1]
+
+
+def analyze_coverage(skill_files: List[Path]) -> Dict[str, List[str]]:
     """Analyze skill coverage vs capability tree. Returns gaps."""
 
     # Capability tree items that should have skills
@@ -245,57 +526,40 @@ def analyze_coverage() -> Dict[str, List[str]]:
 
     # Existing skills
     existing_skills = {}
-    for skill_file in SKILLS_DIR.glob("skill_*.md"):
-        content = skill_file.read_text().lower()
+    for skill_file in skill_files:
         name = skill_file.stem
 
-        # Extract keywords from skill
+        # Tokenize the filename once and look cues up in the keyword map
+        # instead of running a dozen independent substring scans
+        parts = re.split(r'[_\-]', name)
+        tokens = set(parts)
+        # Bigrams catch compound cues like folder_grouping / relative_link
+        tokens.update(f"{a}_{b}" for a, b in zip(parts, parts[1:]))
+
         keywords = set()
-        if 'mindmap' in name or 'mst' in name:
-            keywords.add('mindmap')
-        if 'link' in name:
-            keywords.add('link to pearltrees')
-        if 'mst' in name or 'folder_grouping' in name:
-            keywords.add('mst folder grouping')
-        if 'cross' in name or 'relative_link' in name:
-            keywords.add('cross-references')
-        if 'folder_suggestion' in name or 'suggest' in name:
-            keywords.add('folder suggestion')
-        if 'rename' in name:
-            keywords.add('rename mindmap')
-        if 'index' in name:
-            keywords.add('build index')
-        if 'bookmark' in name:
-            keywords.add('bookmark filing')
-        if 'compile' in name:
-            keywords.add('compile prolog')
-        if 'environment' in name:
-            keywords.add('environment setup')
-        if 'json' in name:
-            keywords.add('data sources')
-        if 'extract' in name:
-            keywords.add('data extraction')
+        for tok in tokens:
+            for variant in _token_variants(tok):
+                hits = _SKILL_KEYWORD_MAP.get(variant)
+                if hits:
+                    keywords.update(hits)
+                    break
 
         existing_skills[name] = keywords
 
-    # Find gaps
-    gaps = {}
+    # Find gaps. Exact matches resolve with one set lookup; only misses
+    # pay the bidirectional substring scan, and only against the small
+    # covered set rather than every skill's keywords.
     all_covered = set()
     for skill_keywords in existing_skills.values():
         all_covered.update(skill_keywords)
 
+    gaps = {}
     for topic, items in capability_tree.items():
-        topic_gaps = []
-        for item in items:
-            # Check if item is covered by any skill
-            covered = False
-            for keyword in all_covered:
-                if item in keyword or keyword in item:
-                    covered = True
-                    break
-            if not covered:
-                topic_gaps.append(item)
-
+        topic_gaps = [
+            item for item in items
+            if item not in all_covered
+            and not any(item in kw or kw in item for kw in all_covered)
+        ]
         if topic_gaps:
             gaps[topic] = topic_gaps
 
@@ -306,11 +570,14 @@ def print_coverage_report():
     """Print coverage analysis report."""
     print("\n=== SKILL COVERAGE ANALYSIS ===\n")
 
+    # Scan the skills directory once and share the listing
+    skill_files = sorted(_resolve_skills_dir().glob("skill_*.md"))
+
     print("Existing skills:")
-    for skill_file in sorted(SKILLS_DIR.glob("skill_*.md")):
+    for skill_file in skill_files:
         print(f"  ✓ {skill_file.name}")
 
-    gaps = analyze_coverage()
+    gaps = analyze_coverage(skill_files)
 
     if gaps:
         print("\n⚠️  Missing skills (capability tree items without skills):\n")
@@ -330,6 +597,93 @@ def print_coverage_report():
     print()
 
 
+class TopicWriter:
+    """Per-topic JSONL appenders, opened lazily and flushed after every write.
+
+    Streaming pairs out as they arrive keeps memory flat and preserves
+    partial progress if a long --all run crashes mid-way.
+    """
+
+    def __init__(self, output_dir: Path, filename: str = "skills-generated.jsonl"):
+        self.output_dir = output_dir
+        self.filename = filename
+        self.counts: Dict[str, int] = {}
+        self._handles: Dict[str, TextIO] = {}
+
+    def path_for(self, topic: str) -> Path:
+        return self.output_dir / topic / self.filename
+
+    def write(self, topic: str, pairs: List[Dict]):
+        if not pairs:
+            return
+        f = self._handles.get(topic)
+        if f is None:
+            output_file = self.path_for(topic)
+            output_file.parent.mkdir(parents=True, exist_ok=True)
+            # Append to existing or create new
+            f = open(output_file, 'a')
+            self._handles[topic] = f
+        # One writelines per batch of pairs instead of a write per pair;
+        # compact separators shave ~10% off the output bytes
+        f.writelines(json.dumps(p, separators=(',', ':')) + '\n' for p in pairs)
+        f.flush()
+        self.counts[topic] = self.counts.get(topic, 0) + len(pairs)
+
+    def close(self):
+        for f in self._handles.values():
+            f.close()
+        self._handles.clear()
+
+
+async def generate_all_skills(
+    skill_files: List[Path],
+    writer: TopicWriter,
+    provider: str,
+    model: str,
+    num_pairs: int,
+    max_workers: int = 4,
+    marshal_batch: int = 1,
+    transport: str = "sdk",
+    use_cache: bool = True
+) -> None:
+    """Generate Q&A for all skills concurrently, streaming pairs to writer."""
+    # Semaphore caps in-flight LLM calls to respect provider rate limits
+    semaphore = asyncio.Semaphore(max_workers)
+
+    def _emit(skill_path: Path, pairs: List[Dict]):
+        topic = infer_topic_from_skill(skill_path.name)
+        writer.write(topic, pairs)
+        print(f"    Generated {len(pairs)} pairs → {topic}/")
+
+    async def _one(skill_path: Path):
+        pairs = await generate_qa_from_skill(
+            skill_path, semaphore,
+            provider=provider, model=model, num_pairs=num_pairs,
+            transport=transport, use_cache=use_cache
+        )
+        _emit(skill_path, pairs)
+
+    async def _batch(batch: List[Path]):
+        batch_results = await generate_qa_from_skill_batch(
+            batch, semaphore,
+            provider=provider, model=model, num_pairs=num_pairs,
+            transport=transport, use_cache=use_cache
+        )
+        for skill_path, pairs in zip(batch, batch_results):
+            _emit(skill_path, pairs)
+
+    if marshal_batch > 1:
+        batch_size = min(marshal_batch, MAX_MARSHAL_BATCH)
+        tasks = [
+            _batch(skill_files[i:i + batch_size])
+            for i in range(0, len(skill_files), batch_size)
+        ]
+    else:
+        tasks = [_one(skill_path) for skill_path in skill_files]
+
+    await asyncio.gather(*tasks)
+
+
 def main():
     parser = argparse.ArgumentParser(description="Generate Q&A from skills documents")
     parser.add_argument("--skill", help="Process specific skill file")
@@ -338,6 +692,15 @@ def main():
     parser.add_argument("--provider", default="claude", choices=["claude", "gemini"])
     parser.add_argument("--model", default="sonnet", help="Model to use")
     parser.add_argument("--pairs", type=int, default=4, help="Q&A pairs per skill")
+    parser.add_argument("--max-workers", type=int, default=4, help="Concurrent LLM calls")
+    parser.add_argument("--marshal-batch", type=int, default=1,
+                        help=f"Skills per LLM call (1 = one call per skill, max {MAX_MARSHAL_BATCH})")
+    parser.add_argument("--batch-api", action="store_true",
+                        help="Submit all skills as one Batch API job (claude only, ~50%% cost)")
+    parser.add_argument("--transport", default="sdk", choices=["sdk", "cli"],
+                        help="Use persistent SDK clients or one CLI subprocess per call")
+    parser.add_argument("--no-cache", action="store_true",
+                        help="Skip the on-disk response cache and force re-generation")
     parser.add_argument("--output", type=Path, default=Path("by-topic"), help="Output directory")
 
     args = parser.parse_args()
@@ -346,57 +709,61 @@ def main():
         print_coverage_report()
         return
 
-    if not SKILLS_DIR.exists():
-        print(f"Error: Skills directory not found: {SKILLS_DIR}", file=sys.stderr)
+    skills_dir = _resolve_skills_dir()
+    if not skills_dir.exists():
+        print(f"Error: Skills directory not found: {skills_dir}", file=sys.stderr)
         sys.exit(1)
 
     if args.skill:
-        skill_files = [SKILLS_DIR / args.skill]
+        skill_files = [skills_dir / args.skill]
     elif args.all:
-        skill_files = sorted(SKILLS_DIR.glob("skill_*.md"))
+        skill_files = sorted(skills_dir.glob("skill_*.md"))
     else:
         print("Specify --skill <filename> or --all")
         print(f"Available skills:")
-        for f in sorted(SKILLS_DIR.glob("skill_*.md")):
+        for f in sorted(skills_dir.glob("skill_*.md")):
             print(f"  {f.name}")
         sys.exit(1)
 
-    # Group results by topic
-    results_by_topic: Dict[str, List[Dict]] = {}
+    missing = [p for p in skill_files if not p.exists()]
+    for skill_path in missing:
+        print(f"Skill not found: {skill_path}")
+    skill_files = [p for p in skill_files if p.exists()]
 
-    for skill_path in skill_files:
-        if not skill_path.exists():
-            print(f"Skill not found: {skill_path}")
-            continue
-
-        pairs = generate_qa_from_skill(
-            skill_path,
-            provider=args.provider,
-            model=args.model,
-            num_pairs=args.pairs
-        )
-
-        topic = infer_topic_from_skill(skill_path.name)
-        results_by_topic.setdefault(topic, []).extend(pairs)
-
-        print(f"    Generated {len(pairs)} pairs → {topic}/")
-
-    # Write output files
-    for topic, pairs in results_by_topic.items():
-        if not pairs:
-            continue
-
-        output_dir = args.output / topic
-        output_dir.mkdir(parents=True, exist_ok=True)
-        output_file = output_dir / "skills-generated.jsonl"
-
-        # Append to existing or create new
-        mode = 'a' if output_file.exists() else 'w'
-        with open(output_file, mode) as f:
-            for pair in pairs:
-                f.write(json.dumps(pair) + '\n')
-
-        print(f"\nWrote {len(pairs)} pairs to {output_file}")
+    writer = TopicWriter(args.output)
+    try:
+        if args.batch_api:
+            if args.provider != "claude":
+                print("--batch-api currently supports only the claude provider", file=sys.stderr)
+                sys.exit(1)
+
+            # Collect all prompts upfront, submit as one batch, demux on poll
+            prompts = [build_skill_prompt(p, args.pairs) for p in skill_files]
+            responses = call_batch_api(prompts, model=args.model)
+
+            for skill_path, response in zip(skill_files, responses):
+                pairs = parse_skill_response(response, skill_path.name)
+                topic = infer_topic_from_skill(skill_path.name)
+                writer.write(topic, pairs)
+                print(f"    Generated {len(pairs)} pairs → {topic}/")
+        else:
+            # Dispatch all skills concurrently, streaming results as they land
+            asyncio.run(generate_all_skills(
+                skill_files,
+                writer,
+                provider=args.provider,
+                model=args.model,
+                num_pairs=args.pairs,
+                max_workers=args.max_workers,
+                marshal_batch=args.marshal_batch,
+                transport=args.transport,
+                use_cache=not args.no_cache
+            ))
+    finally:
+        writer.close()
+
+    for topic, count in writer.counts.items():
+        print(f"\nWrote {count} pairs to {writer.path_for(topic)}")
 
 
 if __name__ == "__main__":
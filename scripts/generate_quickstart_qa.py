@@ -12,13 +12,18 @@ Usage:
 """
 
 import argparse
+import functools
 import json
 import subprocess
 import sys
 import re
+from concurrent.futures import ThreadPoolExecutor
+from itertools import islice
 from pathlib import Path
 from typing import Dict, List, Optional, Any
 
+from llm_client import iter_json_objects
+
 
 # Base path to UnifyWeaver project
 UNIFYWEAVER_BASE = Path(__file__).parent.parent.parent  # training-data/../ = UnifyWeaver
@@ -50,8 +55,10 @@ Generate ONLY the JSONL output, no explanations.'''
 def call_claude_cli(prompt: str, model: str = "sonnet", timeout: int = 120) -> Optional[str]:
     """Call claude CLI with the given prompt."""
     try:
+        # Prompt goes over stdin to stay clear of the argv size ceiling
         result = subprocess.run(
-            ["claude", "-p", "--model", model, prompt],
+            ["claude", "-p", "--model", model],
+            input=prompt,
             capture_output=True,
             text=True,
             timeout=timeout
@@ -73,7 +80,8 @@ def call_gemini_cli(prompt: str, model: str = "gemini-2.5-flash-preview-05-20",
     """Call gemini CLI with the given prompt."""
     try:
         result = subprocess.run(
-            ["gemini", "-p", prompt, "-m", model, "--output-format", "text"],
+            ["gemini", "-m", model, "--output-format", "text"],
+            input=prompt,
             capture_output=True,
             text=True,
             timeout=timeout
@@ -99,8 +107,13 @@ def call_llm(prompt: str, provider: str = "claude", model: str = "sonnet") -> Op
         return call_claude_cli(prompt, model)
 
 
+@functools.lru_cache(maxsize=256)
 def read_source_file(path: str, max_lines: int = 200) -> str:
-    """Read a source file, truncating if too long."""
+    """Read a source file, truncating if too long.
+
+    Memoized: the same source file is often referenced by several
+    sections, and the content is stable for the duration of a run.
+    """
     full_path = UNIFYWEAVER_BASE / path
 
     if full_path.is_dir():
@@ -118,16 +131,22 @@ def read_source_file(path: str, max_lines: int = 200) -> str:
 
     try:
         with open(full_path, 'r', encoding='utf-8', errors='ignore') as f:
-            lines = f.readlines()
-            if len(lines) > max_lines:
-                content = ''.join(lines[:max_lines])
-                content += f"\n... [truncated, {len(lines) - max_lines} more lines]"
+            # Only materialize the lines we keep; readlines() would load
+            # the whole file just to throw most of it away
+            head = list(islice(f, max_lines + 1))
+            if len(head) > max_lines:
+                remaining = 1 + sum(1 for _ in f)
+                content = ''.join(head[:max_lines])
+                content += f"\n... [truncated, {remaining} more lines]"
                 return content
-            return ''.join(lines)
+            return ''.join(head)
     except Exception as e:
         return f"[Error reading {path}: {e}]"
 
 
+_SECTION_RE = re.compile(r'### (.+?) \(Level (\d+)(?:-(\d+))?\)')
+
+
 def parse_source_mapping(mapping_path: Path) -> Dict[str, Dict]:
     """Parse SOURCE_MAPPING.md into structured data."""
     content = mapping_path.read_text()
@@ -137,6 +156,11 @@ def parse_source_mapping(mapping_path: Path) -> Dict[str, Dict]:
     current_section = None
 
     for line in content.split('\n'):
+        # Dispatch on the first character before any prefix tests
+        first = line[:1]
+        if first not in ('#', '|'):
+            continue
+
         # Main topic headers
         if line.startswith('## ') and not line.startswith('## How'):
             current_topic = line[3:].strip().lower().replace(' ', '-')
@@ -144,7 +168,7 @@ def parse_source_mapping(mapping_path: Path) -> Dict[str, Dict]:
 
         # Section headers
         elif line.startswith('### ') and current_topic:
-            section_match = re.match(r'### (.+?) \(Level (\d+)(?:-(\d+))?\)', line)
+            section_match = _SECTION_RE.match(line)
             if section_match:
                 section_name = section_match.group(1).lower().replace(' ', '-')
                 level = int(section_match.group(2))
@@ -155,7 +179,7 @@ def parse_source_mapping(mapping_path: Path) -> Dict[str, Dict]:
                 }
 
         # Table rows with source files
-        elif line.startswith('|') and current_topic and current_section:
+        elif first == '|' and current_topic and current_section:
             parts = [p.strip() for p in line.split('|')[1:-1]]
             if len(parts) >= 2 and parts[0] and not parts[0].startswith('-'):
                 item_name = parts[0]
@@ -185,11 +209,15 @@ def generate_qa_for_section(
         all_sources.extend(item['sources'])
     all_sources = list(set(all_sources))
 
-    # Read source content
-    source_content = ""
-    for src in all_sources[:5]:  # Limit to 5 files
-        content = read_source_file(src, max_lines=150)
-        source_content += f"\n\n=== {src} ===\n{content}"
+    # Read source content. The reads are independent and block on disk,
+    # so overlap them instead of paying each file's latency in sequence.
+    sources = all_sources[:5]  # Limit to 5 files
+    with ThreadPoolExecutor(max_workers=max(len(sources), 1)) as reader:
+        contents = list(reader.map(lambda s: read_source_file(s, max_lines=150), sources))
+    source_content = "".join(
+        f"\n\n=== {src} ===\n{content}"
+        for src, content in zip(sources, contents)
+    )
 
     if len(source_content) > 15000:
         source_content = source_content[:15000] + "\n... [content truncated]"
@@ -223,17 +251,7 @@ def generate_qa_for_section(
         return []
 
     # Parse JSONL response
-    results = []
-    for line in response.split('\n'):
-        line = line.strip()
-        if line.startswith('{'):
-            try:
-                obj = json.loads(line)
-                results.append(obj)
-            except json.JSONDecodeError:
-                pass
-
-    return results
+    return list(iter_json_objects(response))
 
 
 def main():
@@ -270,30 +288,50 @@ def main():
 
         print(f"\n=== {topic_name.upper()} ===")
 
-        all_pairs = []
-        for section_name, section_data in topic_data['sections'].items():
-            if not section_data.get('items'):
-                continue
-
-            pairs = generate_qa_for_section(
-                topic_name, section_name, section_data,
-                provider=args.provider,
-                model=args.model,
-                num_pairs=args.pairs
-            )
-            all_pairs.extend(pairs)
-            print(f"    Generated {len(pairs)} pairs")
-
-        if all_pairs:
-            output_dir = args.output / topic_name
-            output_dir.mkdir(parents=True, exist_ok=True)
-            output_file = output_dir / f"{topic_name}-generated.jsonl"
-
-            with open(output_file, 'w') as f:
-                for pair in all_pairs:
-                    f.write(json.dumps(pair) + '\n')
-
-            print(f"  Wrote {len(all_pairs)} pairs to {output_file}")
+        sections = {
+            name: data for name, data in topic_data['sections'].items()
+            if data.get('items')
+        }
+
+        # Stream pairs to disk as each section finishes so a crashed run
+        # keeps its partial progress and memory stays flat
+        output_file = args.output / topic_name / f"{topic_name}-generated.jsonl"
+        out = None
+        total_pairs = 0
+        try:
+            if sections:
+                # Submit ALL sections first, then collect - collecting inside
+                # the submit loop would serialize the LLM calls again
+                with ThreadPoolExecutor(max_workers=len(sections)) as executor:
+                    futures = {
+                        name: executor.submit(
+                            generate_qa_for_section,
+                            topic_name, name, data,
+                            provider=args.provider,
+                            model=args.model,
+                            num_pairs=args.pairs
+                        )
+                        for name, data in sections.items()
+                    }
+                    for name, future in futures.items():
+                        pairs = future.result()
+                        print(f"    Generated {len(pairs)} pairs for {name}")
+                        if not pairs:
+                            continue
+                        if out is None:
+                            output_file.parent.mkdir(parents=True, exist_ok=True)
+                            out = open(output_file, 'w')
+                        out.writelines(
+                            json.dumps(p, separators=(',', ':')) + '\n' for p in pairs
+                        )
+                        out.flush()
+                        total_pairs += len(pairs)
+        finally:
+            if out:
+                out.close()
+
+        if total_pairs:
+            print(f"  Wrote {total_pairs} pairs to {output_file}")
 
 
 if __name__ == "__main__":
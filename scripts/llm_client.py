@@ -0,0 +1,114 @@
+#!/usr/bin/env python3
+"""
+Persistent LLM SDK clients for the Q&A generation scripts.
+
+Shelling out to the claude/gemini CLIs forks a new process per call, and
+each call pays its own TCP+TLS handshake. The clients here are created
+once per process and reuse one HTTP connection pool (keep-alive) across
+every call in a run.
+
+Both call functions are async so they plug into the asyncio generation
+loop. The CLI subprocess path in the generation scripts remains
+available via --transport cli.
+"""
+
+import functools
+import json
+import sys
+from typing import Iterator, Optional
+
+# CLI model aliases -> API model names
+CLAUDE_MODELS = {
+    "sonnet": "claude-sonnet-4-5",
+    "haiku": "claude-haiku-4-5",
+    "opus": "claude-opus-4-1",
+}
+
+DEFAULT_GEMINI_MODEL = "gemini-3-flash-preview"
+
+# Module-level clients, created on first use and reused for the process
+_anthropic_client = None
+_gemini_client = None
+
+
+def _get_anthropic():
+    global _anthropic_client
+    if _anthropic_client is None:
+        import anthropic
+        _anthropic_client = anthropic.AsyncAnthropic()
+    return _anthropic_client
+
+
+def _get_gemini():
+    global _gemini_client
+    if _gemini_client is None:
+        from google import genai
+        _gemini_client = genai.Client()
+    return _gemini_client
+
+
+def iter_json_objects(response: str) -> Iterator[dict]:
+    """Yield the JSON objects embedded in an LLM response.
+
+    Scans with raw_decode rather than splitting on newlines, so no line
+    list is materialized and objects survive models that emit JSONL
+    without clean one-object-per-line formatting.
+    """
+    decoder = json.JSONDecoder()
+    idx = 0
+    length = len(response)
+    while idx < length:
+        brace = response.find('{', idx)
+        if brace == -1:
+            return
+        try:
+            obj, end = decoder.raw_decode(response, brace)
+        except json.JSONDecodeError:
+            idx = brace + 1
+            continue
+        if isinstance(obj, dict):
+            yield obj
+        idx = end
+
+
+@functools.lru_cache(maxsize=None)
+def sdk_available(provider: str) -> bool:
+    """Check whether the SDK for a provider can be imported."""
+    try:
+        if provider == "gemini":
+            from google import genai  # noqa: F401
+        else:
+            import anthropic  # noqa: F401
+        return True
+    except ImportError:
+        return False
+
+
+async def call_claude_sdk(prompt: str, model: str = "sonnet", timeout: int = 120) -> Optional[str]:
+    """Call the Anthropic API via the persistent SDK client."""
+    try:
+        client = _get_anthropic()
+        message = await client.messages.create(
+            model=CLAUDE_MODELS.get(model, model),
+            max_tokens=4096,
+            messages=[{"role": "user", "content": prompt}],
+            timeout=timeout,
+        )
+        return message.content[0].text.strip()
+    except Exception as e:
+        print(f"Anthropic SDK error: {e}", file=sys.stderr)
+        return None
+
+
+async def call_gemini_sdk(prompt: str, model: str = "", timeout: int = 120) -> Optional[str]:
+    """Call the Gemini API via the persistent SDK client."""
+    try:
+        client = _get_gemini()
+        response = await client.aio.models.generate_content(
+            model=model or DEFAULT_GEMINI_MODEL,
+            contents=prompt,
+        )
+        return (response.text or "").strip()
+    except Exception as e:
+        print(f"Gemini SDK error: {e}", file=sys.stderr)
+        return None